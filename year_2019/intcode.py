@@ -1,11 +1,96 @@
-from typing import Optional
+from array import array
+from collections import deque
+from functools import lru_cache
+from operator import add, eq, lt, mul
+from typing import Callable, Optional, Sequence
+
+# Number of addresses allocated beyond the end of the program when the computer is
+# created. The memory grows geometrically if the program goes beyond it.
+SPARE_MEMORY = 1024
+
+# Opcode and the three parameter modes of an instruction.
+Instruction = tuple[int, int, int, int]
+
+# Opcodes understood by the computer, including the halt instruction.
+OPCODES = frozenset((1, 2, 3, 4, 5, 6, 7, 8, 9, 99))
+
+
+def decode_instruction(value: int) -> Instruction:
+    """Return the opcode and the parameter modes of the given instruction value."""
+    modes, code = divmod(value, 100)
+    return code, modes % 10, modes // 10 % 10, modes // 100 % 10
+
+
+def is_valid_instruction(value: int) -> bool:
+    """Determine whether the given value is a known opcode with every parameter mode
+    being either 0 (position), 1 (immediate) or 2 (relative)."""
+    if value < 0:
+        return False
+    modes, code = divmod(value, 100)
+    if code not in OPCODES:
+        return False
+    while modes:
+        modes, mode = divmod(modes, 10)
+        if mode > 2:
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def compile_program(program: tuple[int, ...]) -> dict[int, Instruction]:
+    """Decode every address of the given program once.
+
+    The result can be shared between the computers running the same program with
+    the decoded option, so that each one of them only copies the decoded mapping.
+    Decoding an address which holds data is harmless as an entry is only used when
+    the pointer reaches it and it is invalidated when the address is written to.
+    Addresses which do not hold a valid instruction are left out, so they are
+    validated when the pointer reaches them.
+    """
+    return {
+        index: decode_instruction(value)
+        for index, value in enumerate(program)
+        if is_valid_instruction(value)
+    }
+
+
+def _binary_instruction(operation: Callable[[int, int], int]):
+    """Return the executor for an instruction which stores the result of the given
+    operation on its first two parameters at the address in its third parameter.
+
+    The arithmetic and comparison instructions make up the bulk of the executed
+    instructions, so the parameter lookup and store are inlined for them. The memory
+    is grown in place, so the local reference stays valid after growing.
+    """
+
+    def execute(self: "IntcodeComputer", decoded: Instruction) -> None:
+        p1, p2, p3, p1_mode, p2_mode, p3_mode = self._decode3(decoded)
+        memory, base = self._memory, self._relative_base
+        size = len(memory)
+        i1 = p1 + base if p1_mode == 2 else p1
+        i2 = p2 + base if p2_mode == 2 else p2
+        v1 = p1 if p1_mode == 1 else memory[i1] if 0 <= i1 < size else 0
+        v2 = p2 if p2_mode == 1 else memory[i2] if 0 <= i2 < size else 0
+        index = p3 + base if p3_mode == 2 else p3
+        if index < 0:
+            raise ValueError(f"invalid address {index} at address {self._pointer}")
+        if index >= size:
+            self._grow_memory(index + 1)
+        # The comparisons return a bool which the array stores as 0 or 1.
+        memory[index] = operation(v1, v2)
+        self._decoded.pop(index, None)
+        self._pointer += 4
+
+    return execute
 
 
 class IntcodeComputer:
     """The Intcode Computer used throughout the Advent of Code puzzles.
 
     Options:
-        program: The intcode program to run on the computer.
+        program: The intcode program to run on the computer. An array("q") is
+            copied without converting every element, so it can be created once and
+            shared when running many computers for the same program.
         inputs: The input to provide when asked for.
         amp_phase: Amplifier phase for the current computer.
         ask_for_input: Ask for input to the user instead of using the inputs parameter.
@@ -17,11 +102,13 @@ class IntcodeComputer:
             state of the computer intact. Defaults to True if amp_phase is given.
         gather_output: Store all the output from the output instruction in a list
             and return it once the program ends.
+        decoded: The decoded program as returned by compile_program to avoid
+            decoding the same program for every computer.
     """
 
     def __init__(
         self,
-        program: list[int],
+        program: Sequence[int],
         inputs: Optional[list[int]] = None,
         amp_phase: Optional[int] = None,
         ask_for_input: bool = False,
@@ -30,6 +117,7 @@ class IntcodeComputer:
         print_output: bool = False,
         return_output: bool = False,
         gather_output: bool = False,
+        decoded: Optional[dict[int, Instruction]] = None,
     ) -> None:
         if inputs is None:
             inputs = []
@@ -48,14 +136,22 @@ class IntcodeComputer:
         self._outputs = []
         self._relative_base = 0
 
-        # Internally, the entire program is stored in dictionary to account for an
-        # arbitrary sized memory.
-        internal = {index: value for index, value in enumerate(program)}
-        self._inputs = inputs.copy()
-        self._memory = internal.copy()
+        # Internally, the entire program is stored in a contiguous array of 64-bit
+        # integers which is extended as required to account for an arbitrary sized
+        # memory. Unwritten addresses are zero.
+        internal = array("q", program)
+        internal.frombytes(bytes(internal.itemsize * SPARE_MEMORY))
+        self._inputs = deque(inputs)
+        self._memory = internal[:]
         self._original_program = internal
         self._original_inputs = inputs
 
+        # Decoded instructions (opcode and parameter modes) are cached by their
+        # memory address so that each instruction is parsed only once. An entry is
+        # invalidated whenever the program writes to that address.
+        self._original_decoded = {} if decoded is None else decoded
+        self._decoded = self._original_decoded.copy()
+
     def reset(self) -> None:
         """Reset the computer to its initial state.
 
@@ -65,10 +161,11 @@ class IntcodeComputer:
         - Pointer
         - Outputs
         """
-        self._memory = self._original_program.copy()
-        self._inputs = self._original_inputs.copy()
+        self._memory = self._original_program[:]
+        self._inputs = deque(self._original_inputs)
         self._pointer = 0
         self._outputs = []
+        self._decoded = self._original_decoded.copy()
 
     @property
     def value(self) -> int:
@@ -77,11 +174,11 @@ class IntcodeComputer:
 
     def halted(self) -> bool:
         """Determine whether the computer has halted or not."""
-        return self.value == 99
+        return self._decode()[0] == 99
 
     def current_code(self) -> str:
         """Return the current instruction code at the current pointer."""
-        return str(self.value)[-1]
+        return str(self._decode()[0])
 
     def append_inputs(self, *inputs) -> None:
         """Append the given inputs for the computer to use."""
@@ -89,63 +186,94 @@ class IntcodeComputer:
             self._inputs.append(i)
 
     def run(self):
-        while not self.halted():
-            code = self.current_code()
-            if code == "3" and self.return_before_input and not self._returned:
+        # Bind the attributes used on every instruction to locals.
+        decode = self._decode
+        dispatch = self._dispatch
+        return_before_input = self.return_before_input
+        while True:
+            decoded = decode()
+            code = decoded[0]
+            if code == 99:
+                break
+            if code == 3 and return_before_input and not self._returned:
                 self._returned = True
                 return self.sentinel_return
-            execute_func = getattr(self, f"_execute_code_{code}")
-            output = execute_func()
+            output = dispatch[code](self, decoded)
             if output is not None:
                 return output
-            if self.return_before_input:
+            if return_before_input:
                 self._returned = False
         if self.gather_output:
             return self._outputs
 
-    def _param_val_and_mode(self, param_qty: int) -> tuple[int, ...]:
-        p = self._pointer
-        parameters = [self._memory[k] for k in range(p + 1, p + param_qty + 1)]
-        instruction = str(self.value).zfill(param_qty + 2)
-        parameters_mode = [int(i) for i in instruction[-3::-1]]
-        return (*parameters, *parameters_mode)
+    def _decode(self) -> Instruction:
+        """Return the opcode and the parameter modes of the current instruction."""
+        try:
+            return self._decoded[self._pointer]
+        except KeyError:
+            value = self.value
+            if not is_valid_instruction(value):
+                raise ValueError(
+                    f"invalid instruction {value} at address {self._pointer}"
+                )
+            decoded = decode_instruction(value)
+            self._decoded[self._pointer] = decoded
+            return decoded
+
+    # The parameters and their modes for the instructions taking one, two and three
+    # parameters respectively. The modes come from the instruction already decoded by
+    # the run loop.
+    def _decode1(self, decoded: Instruction) -> tuple[int, int]:
+        return self._memory[self._pointer + 1], decoded[1]
+
+    def _decode2(self, decoded: Instruction) -> tuple[int, int, int, int]:
+        p, memory = self._pointer, self._memory
+        _, m1, m2, _ = decoded
+        return memory[p + 1], memory[p + 2], m1, m2
+
+    def _decode3(self, decoded: Instruction) -> tuple[int, int, int, int, int, int]:
+        p, memory = self._pointer, self._memory
+        _, m1, m2, m3 = decoded
+        return memory[p + 1], memory[p + 2], memory[p + 3], m1, m2, m3
+
+    def _grow_memory(self, size: int) -> None:
+        """Grow the memory to at least the given size, at least doubling it."""
+        extra = max(size, 2 * len(self._memory)) - len(self._memory)
+        self._memory.frombytes(bytes(self._memory.itemsize * extra))
 
     def _value_for_mode(self, index, mode):
         if mode == 1:  # immediate mode
             return index
         elif mode == 2:  # relative mode
             index += self._relative_base
-        return self._memory.get(index, 0)
+        # Reading beyond the allocated memory does not grow it as those addresses
+        # are zero until written to. A negative address would wrap around to the
+        # end of the array, so it reads as zero as well.
+        return self._memory[index] if 0 <= index < len(self._memory) else 0
 
     def _store_in_memory(self, index, mode, value):
         if mode == 2:
             index += self._relative_base
+        if index < 0:
+            raise ValueError(f"invalid address {index} at address {self._pointer}")
+        if index >= len(self._memory):
+            self._grow_memory(index + 1)
         self._memory[index] = value
+        self._decoded.pop(index, None)
 
-    def _execute_code_1(self):
-        p1, p2, p3, p1_mode, p2_mode, p3_mode = self._param_val_and_mode(3)
-        v1 = self._value_for_mode(p1, p1_mode)
-        v2 = self._value_for_mode(p2, p2_mode)
-        self._store_in_memory(p3, p3_mode, v1 + v2)
-        self._pointer += 4
+    _execute_code_1 = _binary_instruction(add)
+    _execute_code_2 = _binary_instruction(mul)
 
-    def _execute_code_2(self):
-        p1, p2, p3, p1_mode, p2_mode, p3_mode = self._param_val_and_mode(3)
-        v1 = self._value_for_mode(p1, p1_mode)
-        v2 = self._value_for_mode(p2, p2_mode)
-        self._store_in_memory(p3, p3_mode, v1 * v2)
-        self._pointer += 4
-
-    def _execute_code_3(self):
-        p1, p1_mode = self._param_val_and_mode(1)
+    def _execute_code_3(self, decoded):
+        p1, p1_mode = self._decode1(decoded)
         if self.ask_for_input:
             self._store_in_memory(p1, p1_mode, int(input("Input: ")))
         else:
-            self._store_in_memory(p1, p1_mode, self._inputs.pop(0))
+            self._store_in_memory(p1, p1_mode, self._inputs.popleft())
         self._pointer += 2
 
-    def _execute_code_4(self):
-        p1, p1_mode = self._param_val_and_mode(1)
+    def _execute_code_4(self, decoded):
+        p1, p1_mode = self._decode1(decoded)
         v1 = self._value_for_mode(p1, p1_mode)
         if self.gather_output:
             self._outputs.append(v1)
@@ -155,34 +283,39 @@ class IntcodeComputer:
         if self.return_output:
             return v1
 
-    def _execute_code_5(self):
-        p1, p2, p1_mode, p2_mode = self._param_val_and_mode(2)
+    def _execute_code_5(self, decoded):
+        p1, p2, p1_mode, p2_mode = self._decode2(decoded)
         check = self._value_for_mode(p1, p1_mode)
         jump = self._value_for_mode(p2, p2_mode)
         self._pointer = jump if check else self._pointer + 3
 
-    def _execute_code_6(self):
-        p1, p2, p1_mode, p2_mode = self._param_val_and_mode(2)
+    def _execute_code_6(self, decoded):
+        p1, p2, p1_mode, p2_mode = self._decode2(decoded)
         check = self._value_for_mode(p1, p1_mode)
         jump = self._value_for_mode(p2, p2_mode)
         self._pointer = jump if not check else self._pointer + 3
 
-    def _execute_code_7(self):
-        p1, p2, p3, p1_mode, p2_mode, p3_mode = self._param_val_and_mode(3)
-        v1 = self._value_for_mode(p1, p1_mode)
-        v2 = self._value_for_mode(p2, p2_mode)
-        self._store_in_memory(p3, p3_mode, int(v1 < v2))
-        self._pointer += 4
-
-    def _execute_code_8(self):
-        p1, p2, p3, p1_mode, p2_mode, p3_mode = self._param_val_and_mode(3)
-        v1 = self._value_for_mode(p1, p1_mode)
-        v2 = self._value_for_mode(p2, p2_mode)
-        self._store_in_memory(p3, p3_mode, int(v1 == v2))
-        self._pointer += 4
+    _execute_code_7 = _binary_instruction(lt)
+    _execute_code_8 = _binary_instruction(eq)
 
-    def _execute_code_9(self):
-        p1, p1_mode = self._param_val_and_mode(1)
+    def _execute_code_9(self, decoded):
+        p1, p1_mode = self._decode1(decoded)
         p1 = self._value_for_mode(p1, p1_mode)
         self._relative_base += p1
         self._pointer += 2
+
+    # Jump table indexed by the opcode of the instruction. It holds the plain
+    # functions which are called with the computer, so that there is a single table
+    # for the class instead of a table of bound methods for every computer.
+    _dispatch = (
+        None,
+        _execute_code_1,
+        _execute_code_2,
+        _execute_code_3,
+        _execute_code_4,
+        _execute_code_5,
+        _execute_code_6,
+        _execute_code_7,
+        _execute_code_8,
+        _execute_code_9,
+    )
@@ -1,18 +1,11 @@
 # https://adventofcode.com/2019/day/1
 
-MASS_LIST = []
-
 with open("input/01.txt") as inp:
-    for line in inp:
-        data = int(line.strip())
-        MASS_LIST.append(data)
+    MASS_LIST = list(map(int, inp.read().split()))
 
 
 def solution1_1():
-    total_fuel = 0
-    for mass in MASS_LIST:
-        total_fuel += (mass // 3) - 2
-    return total_fuel
+    return sum((mass // 3) - 2 for mass in MASS_LIST)
 
 
 print(f"{solution1_1() = }")
@@ -21,11 +14,8 @@ print(f"{solution1_1() = }")
 def solution1_2():
     total_fuel = 0
     for mass in MASS_LIST:
-        fuel = 0
-        while mass > 0:
-            mass = (mass // 3) - 2
-            fuel += mass
-        total_fuel += fuel + abs(mass)
+        while (mass := (mass // 3) - 2) > 0:
+            total_fuel += mass
     return total_fuel
 
 
@@ -1,104 +1,71 @@
 # https://adventofcode.com/2019/day/3
 
-# I tried using sympy but that was way too slow and then I found this library
-# which is based on GEOS which I have no idea what it is but it's really fast.
-# One of the core reason is that shapely is in C while sympy is pure python.
-from typing import Iterable, List, Tuple
+# Both the wires are walked one unit step at a time. The points visited by the
+# first wire are stored along with the steps taken to first reach them, so the
+# intersections are found with a dictionary lookup while walking the second wire.
+# This is linear in the length of the wires instead of comparing every segment of
+# one wire with every segment of the other.
+from typing import Dict, Iterable, Iterator, Tuple
 
-from shapely.geometry import LineString, Point
+# (x, y)
+Point = Tuple[int, int]
 
-WIRES_PATH = []
+DELTA = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
 
 with open("input/03.txt") as inp:
-    for line in inp:
-        WIRES_PATH.append(line.strip().split(","))
+    WIRES_PATH = [line.split(",") for line in inp.read().splitlines()]
 
 
-# Helper function to generate the segments between points
-def make_segments(wire_path: Iterable[str]) -> List[LineString]:
-    # we will represent start and end as tuple because we just want the
-    # segment object and not the intermediate point object
-    start = (0, 0)
-    segments = []
+# Helper function to generate every point visited by the wire along with the
+# number of steps taken to reach it
+def walk(wire_path: Iterable[str]) -> Iterator[Tuple[Point, int]]:
+    x = y = steps = 0
     for path in wire_path:
-        shift = int(path[1:])
-        if "R" in path:
-            end = start[0] + shift, start[1]
-        elif "L" in path:
-            end = start[0] - shift, start[1]
-        elif "U" in path:
-            end = start[0], start[1] + shift
-        else:
-            end = start[0], start[1] - shift
-        segments.append(LineString((start, end)))
-        start = end
-    return segments
+        dx, dy = DELTA[path[0]]
+        for _ in range(int(path[1:])):
+            x += dx
+            y += dy
+            steps += 1
+            yield (x, y), steps
+
+
+def find_intersections() -> Dict[Point, int]:
+    """Return the intersection points of both the wires mapped to the combined
+    steps taken by the wires to first reach them."""
+    first_wire_steps: Dict[Point, int] = {}
+    for point, steps in walk(WIRES_PATH[0]):
+        first_wire_steps.setdefault(point, steps)
+    intersections: Dict[Point, int] = {}
+    for point, steps in walk(WIRES_PATH[1]):
+        # The central port where both the wires start does not count as an
+        # intersection even if the wires pass through it again
+        if point == (0, 0):
+            continue
+        if point in first_wire_steps and point not in intersections:
+            intersections[point] = first_wire_steps[point] + steps
+    return intersections
 
 
 # Keep this global to let both function have access to it
-FIRST_WIRE_SEGMENTS = make_segments(WIRES_PATH[0])
-SECOND_WIRE_SEGMENTS = make_segments(WIRES_PATH[1])
+INTERSECTIONS = find_intersections()
 del WIRES_PATH  # declutter globals
 
 
 # ------------------ FIRST HALF OF THE PUZZLE --------------------
-def closest_distance() -> Tuple[int, Point, List[Point]]:
-    # starting value 'inf' as we have to find the minimum distance
-    min_distance = float("INF")
-    min_intersection_pt = None
-    intersection_points = []  # for second part of the puzzle
-    # loop over all the possible combinations from first wire segments and
-    # second wire segments
-    for first_segment in FIRST_WIRE_SEGMENTS:
-        for second_segment in SECOND_WIRE_SEGMENTS:
-            if first_segment.intersects(second_segment):
-                # Find the intersection point only if it intersects otherwise
-                # its just a waste of computational time
-                int_pt = first_segment.intersection(second_segment)
-                intersection_points.append(int_pt)
-                taxicab_dist = abs(int_pt.x) + abs(int_pt.y)
-                # We don't want to include the 0.0 distance
-                if taxicab_dist < min_distance and taxicab_dist:
-                    min_distance = taxicab_dist
-                    min_intersection_pt = int_pt
-    return (
-        int(min_distance),
-        min_intersection_pt,
-        intersection_points[1:],
-    )  # first point is (0, 0)
-
-
-distance, closest_pt, intersection_pts = closest_distance()
+def closest_distance() -> Tuple[int, Point]:
+    point = min(INTERSECTIONS, key=lambda p: abs(p[0]) + abs(p[1]))
+    return abs(point[0]) + abs(point[1]), point
+
+
+distance, closest_pt = closest_distance()
 print("Shortest distance:", distance)
 print("Closest intersection point:", closest_pt)
 
 
 # --------------------- SECOND HALF OF THE PUZZLE ----------------------
 def min_step_count() -> Tuple[int, Point]:
-    min_steps = float("INF")
-    min_intersection = None
-    # loop through all the intersection points
-    for point in intersection_pts:
-        combined_steps = 0
-        # find the step count for each wire
-        for wire_segments in [FIRST_WIRE_SEGMENTS, SECOND_WIRE_SEGMENTS]:
-            for segment in wire_segments:
-                # if point is in segment then add the distance between the
-                # starting point of the segment and the intersection point
-                if point.within(segment):
-                    # xy attribute gives you a two tuple containing array where
-                    # the first array has all x coordinates and the second array
-                    # has all the y coordinates
-                    x1, y1 = segment.xy[0][0], segment.xy[1][0]
-                    combined_steps += abs(x1 - point.x) + abs(y1 - point.y)
-                    break  # we have reached the intersection point, so break
-                # else just add the segment length
-                else:
-                    combined_steps += segment.length
-        if combined_steps < min_steps:
-            min_steps = combined_steps
-            min_intersection = point
-    return int(min_steps), min_intersection
+    point = min(INTERSECTIONS, key=INTERSECTIONS.__getitem__)
+    return INTERSECTIONS[point], point
 
 
 steps, better_int = min_step_count()
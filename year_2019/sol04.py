@@ -1,43 +1,69 @@
 # https://adventofcode.com/2019/day/4
 
-from collections import Counter
-from itertools import combinations_with_replacement
-from operator import eq, gt
-from typing import Callable, Iterable
+from typing import Iterator, Sequence
 
 # Puzzle input
 MINIMUM, MAXIMUM = 178416, 676461
 
 
-# Helper function to check whether the number is in input range
-def input_range_check(digit_list: Iterable[int]) -> bool:
-    number = int("".join(map(str, digit_list)))
-    return MINIMUM < number < MAXIMUM
-
-
-# This creates a list of all the possible combinations for the base conditions:
+# This generates all the possible combinations for the base conditions:
 # A six digit number
 # Digits are either increasing or repeating but never decreasing
 # Number lies within the puzzle input range
-POSSIBLE_COMBINATIONS = list(
-    filter(input_range_check, combinations_with_replacement(range(1, 10), 6))
-)
+#
+# The digits are chosen from left to right. For every prefix, the smallest and the
+# largest number which can be made from it are compared against the input range
+# to skip the entire subtree of combinations which lies outside of it.
+def possible_combinations(
+    digit_list: tuple[int, ...] = (), number: int = 0
+) -> Iterator[tuple[int, ...]]:
+    if len(digit_list) == 6:
+        yield digit_list
+        return
+    scale = 10 ** (5 - len(digit_list))
+    for digit in range(digit_list[-1] if digit_list else 1, 10):
+        prefix = number * 10 + digit
+        smallest = prefix * scale + digit * (scale - 1) // 9
+        largest = prefix * scale + scale - 1
+        if largest <= MINIMUM:
+            continue
+        if smallest >= MAXIMUM:
+            break
+        yield from possible_combinations((*digit_list, digit), prefix)
+
+
+POSSIBLE_COMBINATIONS = list(possible_combinations())
+
+
+# As the digits are never decreasing, the repeating digits are always adjacent and
+# their count is the length of the run.
+def run_lengths(digit_list: Sequence[int]) -> list[int]:
+    runs = []
+    run = 1
+    for previous, digit in zip(digit_list, digit_list[1:]):
+        if digit == previous:
+            run += 1
+        else:
+            runs.append(run)
+            run = 1
+    runs.append(run)
+    return runs
 
 
 # The only difference between the first part and the second part of the puzzle
-# is the compare and number input. For first part, we need atleast one digit
-# which is repeating one or more times. For the second part, we need atleast
-# one digit which is repeating atmost two times.
-def password_count(compare: Callable[[int, int], bool], number: int) -> int:
-    poss_count = 0
+# is the run length condition. For first part, we need atleast one digit which is
+# repeating one or more times. For the second part, we need atleast one digit
+# which is repeating atmost two times. Both the counts are computed in one pass.
+def password_count() -> tuple[int, int]:
+    first = second = 0
     for num_dig in POSSIBLE_COMBINATIONS:
-        count_dict = Counter(num_dig)
-        for digit in count_dict:
-            if compare(count_dict[digit], number):
-                poss_count += 1
-                break
-    return poss_count
+        runs = run_lengths(num_dig)
+        if len(runs) < 6:
+            first += 1
+        if 2 in runs:
+            second += 1
+    return first, second
 
 
-first, second = password_count(gt, 1), password_count(eq, 2)
+first, second = password_count()
 print(f"First part: {first} \nSecond part: {second}")
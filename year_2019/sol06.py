@@ -23,61 +23,48 @@ def parse_map_data():
     else:
         with open("input/06.txt") as fd:
             map_data = fd.read()
-    child_to_parent, parent_to_child = {}, {}
-    for orbit in map_data.strip().split("\n"):
+    child_to_parent = {}
+    for orbit in map_data.splitlines():
         center, orbiter = orbit.split(")")
-        parent_to_child.setdefault(center, []).append(orbiter)
         child_to_parent[orbiter] = center
-    return parent_to_child, child_to_parent
+    return child_to_parent
 
 
-PARENT_TO_CHILD, CHILD_TO_PARENT = parse_map_data()
+CHILD_TO_PARENT = parse_map_data()
 
 
 def count_orbits() -> int:
-    cache: dict[str, int] = {}
-
-    def loop(object_id: str) -> int:
-        if object_id in cache:
-            return cache[object_id]
-        count = 0
-        for orbiter_orbit in PARENT_TO_CHILD.get(object_id, []):
-            count += 1 + loop(orbiter_orbit)
-        cache[object_id] = count
-        return count
-
-    return sum(map(loop, PARENT_TO_CHILD))
+    # The number of direct and indirect orbits of an object is its depth in the orbit
+    # tree. Walk up from every object until an object with a known depth is reached
+    # and assign the depths on the way back, so every object is resolved only once.
+    depth: dict[str, int] = {"COM": 0}
+    for object_id in CHILD_TO_PARENT:
+        chain = []
+        while object_id not in depth:
+            chain.append(object_id)
+            object_id = CHILD_TO_PARENT[object_id]
+        current = depth[object_id]
+        for orbiter in reversed(chain):
+            current += 1
+            depth[orbiter] = current
+    return sum(depth.values())
 
 
 def min_orbital_transfers() -> int:
-    # Backtracking search
-    visited: list[str] = ["YOU"]
-
-    def get_children(node: str) -> list[str]:
-        # A parent can have multiple children but a child only has one parent.
-        children = []
-        child = CHILD_TO_PARENT.get(node, "")
-        if child and child not in visited:
-            children.append(child)
-        for parent in PARENT_TO_CHILD.get(node, []):
-            if parent not in visited:
-                children.append(parent)
-        return children
-
-    def visit(node: str, transfers: int = 0):
-        for child in get_children(node):
-            if child == "SAN":
-                return transfers
-            visited.append(child)
-            # `total_transfers` is different than `transfers`, where the former is
-            # an indication whether the current path lead to "SAN" or a dead end.
-            # If `total_transfers` is 0, then the visit lead us to a dead end, so we
-            # will visit the other children.
-            if total_transfers := visit(child, transfers + 1):
-                return total_transfers
-        return 0
-
-    return visit(CHILD_TO_PARENT["YOU"])
+    # Record the number of transfers from the object "YOU" is orbiting to each of its
+    # ancestors, then walk up from the object "SAN" is orbiting until one of them is
+    # reached, which is the closest common ancestor of both.
+    you_transfers: dict[str, int] = {}
+    object_id, transfers = CHILD_TO_PARENT["YOU"], 0
+    while object_id is not None:
+        you_transfers[object_id] = transfers
+        object_id = CHILD_TO_PARENT.get(object_id)
+        transfers += 1
+    object_id, transfers = CHILD_TO_PARENT["SAN"], 0
+    while object_id not in you_transfers:
+        object_id = CHILD_TO_PARENT[object_id]
+        transfers += 1
+    return transfers + you_transfers[object_id]
 
 
 print("Total orbits =>", count_orbits())
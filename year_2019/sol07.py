@@ -1,16 +1,21 @@
+from array import array
 from itertools import permutations
 
 try:
-    from intcode import IntcodeComputer
+    from intcode import IntcodeComputer, compile_program
 except ImportError:
-    from .intcode import IntcodeComputer
+    from .intcode import IntcodeComputer, compile_program
 
 
 def max_signal(intcode_program, phase_range):
     thruster_signals = {}
+    program = array("q", intcode_program)
+    decoded = compile_program(tuple(intcode_program))
     for phase_setting in permutations(phase_range, 5):
         computers = [
-            IntcodeComputer(intcode_program, amp_phase=phase, return_output=True)
+            IntcodeComputer(
+                program, amp_phase=phase, return_output=True, decoded=decoded
+            )
             for phase in phase_setting
         ]
         signal_input = 0
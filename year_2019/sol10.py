@@ -1,4 +1,4 @@
-from math import atan2, pi, sqrt
+from math import atan2, gcd, pi, sqrt
 
 ASTEROIDS_LOCATION: list[tuple[int, int]] = []
 
@@ -13,12 +13,8 @@ def parse_data(data: list[str]) -> None:
 
 def angle(x1: int, y1: int, x2: int, y2: int) -> float:
     """Return the angle of two points in terms of the positive Y-axis."""
-    a = atan2(y2 - y1, x2 - x1)
-    if a < 0.0 and a < (-pi / 2):
-        a += (5 * pi) / 2
-    else:
-        a += pi / 2
-    return a
+    a = atan2(y2 - y1, x2 - x1) + pi / 2
+    return a if a >= 0.0 else a + 2 * pi
 
 
 def distance(x1: int, y1: int, x2: int, y2: int) -> float:
@@ -33,23 +29,27 @@ def max_asteroids_detected() -> tuple[tuple[int, int], int]:
 
     Algorithm:
         Loop over each asteroid making it the origin and count the number of asteroids
-        visible from that station. The counting is done by calculating the arctangent
-        which is basically the angle where the tangent of the angle equals opposite by
-        adjacent distance.
+        visible from that station. The counting is done by reducing the direction
+        vector from the station to every other asteroid by the greatest common
+        divisor of its components.
 
-        tan(θ) = y/x  (y = opposite distance, x = adjacent distance)
-        Thus, arctan(y/x) = θ
+        (dx, dy) => (dx / g, dy / g)  where g = gcd(dx, dy)
 
-        By keeping the angles in a set, we will remove all the duplicates meaning we
-        will remove all the asteroids which are not in our line of sight. The length
-        of the set will become the number of asteroids visible from that station.
+        All the asteroids in the same line of sight reduce to the same direction, so
+        by keeping the directions in a set, we will remove all the asteroids which are
+        not in our line of sight. The length of the set will become the number of
+        asteroids visible from that station. Unlike comparing floating point angles,
+        this is exact.
     """
     count_data: dict[tuple[int, int], int] = {}
-    for index, origin in enumerate(ASTEROIDS_LOCATION):
-        angles: set[float] = set()
-        for other in ASTEROIDS_LOCATION[:index] + ASTEROIDS_LOCATION[index + 1 :]:
-            angles.add(angle(*origin, *other))
-        count_data[origin] = len(angles)
+    for x1, y1 in ASTEROIDS_LOCATION:
+        directions: set[tuple[int, int]] = set()
+        for x2, y2 in ASTEROIDS_LOCATION:
+            dx, dy = x2 - x1, y2 - y1
+            if dx or dy:
+                g = gcd(dx, dy)
+                directions.add((dx // g, dy // g))
+        count_data[(x1, y1)] = len(directions)
     max_count_point = max(count_data, key=count_data.get)
     return max_count_point, count_data[max_count_point]
 
@@ -64,8 +64,9 @@ def get_sorted_points_from_station(
     asteroid will be vaporized first.
     """
     location_to_angle = {}
-    index = ASTEROIDS_LOCATION.index(station_location)
-    for other in ASTEROIDS_LOCATION[:index] + ASTEROIDS_LOCATION[index + 1 :]:
+    for other in ASTEROIDS_LOCATION:
+        if other == station_location:
+            continue
         curr_angle = angle(*station_location, *other)
         curr_distance = distance(*station_location, *other)
         location_to_angle[other] = curr_angle, curr_distance
@@ -80,36 +81,20 @@ def asteroid_200(sorted_points: dict[tuple[int, int], float]) -> tuple[int, int]
     starts from the top and rotates clockwise.
 
     As we now have the sorted dictionary of angles as per the distance of the
-    asteroid, we just need to make sure the asteroids in the same line will be handled
-    appropriately.
-
-    Recursion will be used for the next rotation. If the angle of the current asteroid
-    is the same as that of the previous asteroid, the item will be added in the
-    dictionary which will be used to make the recursive call. Once we reach the 200th
-    asteroid, we will return the location of that asteroid.
-
-    There's a cheeky way to do this without recursion: As we know that the maximum
-    number of asteroids visible in our line of sight from the station is 211 and we
-    need the 200th asteroid, we can just do a normal loop, skip the same angle
-    asteroids and return the 200th one without a need to make a second rotation. But,
-    ofcourse this is assuming the number of asteroids visible is greater than 200.
+    asteroid, the asteroids in the same line are next to each other with the closest
+    one first. The n-th asteroid in a line will be vaporized in the n-th rotation of
+    the laser, so the order in which the asteroids are vaporized is given by sorting
+    them by the rotation and then by the angle. This is a single pass and sort
+    irrespective of the number of rotations required to reach the 200th asteroid.
     """
-    items = sorted_points.copy()
-
-    def loop(curr_items, count, prev_angle):
-        next_items = {}
-        for point, curr_angle in curr_items.items():
-            if count == 200:
-                return point
-            if curr_angle == prev_angle:
-                next_items[point] = curr_angle
-                continue
-            prev_angle = curr_angle
-            count += 1
-        if next_items:
-            loop(next_items, count, prev_angle)
-
-    return loop(items, 1, None)
+    order = []
+    prev_angle, rotation = None, 0
+    for point, curr_angle in sorted_points.items():
+        rotation = rotation + 1 if curr_angle == prev_angle else 0
+        prev_angle = curr_angle
+        order.append((rotation, curr_angle, point))
+    order.sort()
+    return order[199][2]
 
 
 if __name__ == "__main__":
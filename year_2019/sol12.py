@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from itertools import permutations
+from itertools import combinations
 from math import gcd
 
 INPUT_DATA = [
@@ -9,61 +8,34 @@ INPUT_DATA = [
     (6, 0, -1),
 ]
 
-PAIRS = list(permutations(range(4), 2))
+# Gravity pulls both the moons of a pair towards each other, so every pair is only
+# considered once.
+PAIRS = list(combinations(range(len(INPUT_DATA)), 2))
 
+# The moons are stored as a structure of arrays, that is one list per axis holding
+# the position (or velocity) of every moon along that axis. This keeps the state as
+# plain lists of ints instead of attributes on an object per moon.
+Axis = list[int]
 
-@dataclass(frozen=False)
-class Moon:
-    x: int
-    y: int
-    z: int
-    vx: int = 0
-    vy: int = 0
-    vz: int = 0
 
-    def __post_init__(self):
-        self._x = self.x
-        self._y = self.y
-        self._z = self.z
+def initial_state() -> tuple[list[Axis], list[Axis]]:
+    positions = [list(axis) for axis in zip(*INPUT_DATA)]
+    velocities = [[0] * len(INPUT_DATA) for _ in positions]
+    return positions, velocities
 
-    def apply_gravity(self, o: "Moon") -> None:
-        x, y, z = self.x, self.y, self.z
-        ox, oy, oz = o.x, o.y, o.z
-        self.vx = self.vx + 1 if x < ox else self.vx - 1 if x > ox else self.vx
-        self.vy = self.vy + 1 if y < oy else self.vy - 1 if y > oy else self.vy
-        self.vz = self.vz + 1 if z < oz else self.vz - 1 if z > oz else self.vz
 
-    def apply_velocity(self) -> None:
-        self.x += self.vx
-        self.y += self.vy
-        self.z += self.vz
-
-    def potential_energy(self) -> int:
-        return sum((abs(self.x), abs(self.y), abs(self.z)))
-
-    def kinetic_energy(self) -> int:
-        return sum((abs(self.vx), abs(self.vy), abs(self.vz)))
-
-    def total_energy(self) -> int:
-        return self.kinetic_energy() * self.potential_energy()
-
-    def is_initial_x(self) -> bool:
-        return self.x == self._x and self.vx == 0
-
-    def is_initial_y(self) -> bool:
-        return self.y == self._y and self.vy == 0
-
-    def is_initial_z(self) -> bool:
-        return self.z == self._z and self.vz == 0
-
-    def reset(self) -> None:
-        self.x = self._x
-        self.y = self._y
-        self.z = self._z
-        self.vx = self.vy = self.vz = 0
-
-
-moons = [Moon(*data) for data in INPUT_DATA]
+def apply_step(pos: Axis, vel: Axis) -> None:
+    """Apply gravity and then velocity to every moon along a single axis."""
+    for i, j in PAIRS:
+        p1, p2 = pos[i], pos[j]
+        if p1 < p2:
+            vel[i] += 1
+            vel[j] -= 1
+        elif p1 > p2:
+            vel[i] -= 1
+            vel[j] += 1
+    for i, v in enumerate(vel):
+        pos[i] += v
 
 
 def lcd(n1: int, n2: int) -> int:
@@ -71,28 +43,33 @@ def lcd(n1: int, n2: int) -> int:
 
 
 def energy_after_n_steps(n: int) -> int:
+    positions, velocities = initial_state()
     for i in range(n):
-        for m1, m2 in PAIRS:
-            moons[m1].apply_gravity(moons[m2])
-        for m in moons:
-            m.apply_velocity()
-    return sum(m.total_energy() for m in moons)
+        for pos, vel in zip(positions, velocities):
+            apply_step(pos, vel)
+    potential = (sum(map(abs, moon)) for moon in zip(*positions))
+    kinetic = (sum(map(abs, moon)) for moon in zip(*velocities))
+    return sum(p * k for p, k in zip(potential, kinetic))
+
+
+def axis_period(pos: Axis, vel: Axis) -> int:
+    """Return the number of steps for the moons to return to their initial position
+    and velocity along a single axis."""
+    initial_pos = pos.copy()
+    n = 0
+    while True:
+        apply_step(pos, vel)
+        n += 1
+        if pos == initial_pos and not any(vel):
+            return n
 
 
 def steps_to_reach_initial_state():
-    n = nx = ny = nz = 0
-    while not (nx and ny and nz):
-        for m1, m2 in PAIRS:
-            moons[m1].apply_gravity(moons[m2])
-        for m in moons:
-            m.apply_velocity()
-        n += 1
-        if nx == 0 and all(m.is_initial_x() for m in moons):
-            nx = n
-        if ny == 0 and all(m.is_initial_y() for m in moons):
-            ny = n
-        if nz == 0 and all(m.is_initial_z() for m in moons):
-            nz = n
+    # The axes are independent of each other, so each one is simulated on its own
+    # until it repeats and the whole system repeats at the least common multiple of
+    # the periods of all the axes.
+    positions, velocities = initial_state()
+    nx, ny, nz = map(axis_period, positions, velocities)
     return lcd(lcd(nx, ny), nz)
 
 
@@ -100,10 +77,6 @@ if __name__ == "__main__":
     print(
         f"Total energy in the system after 1000 steps => {energy_after_n_steps(1000)}"
     )
-
-    for m in moons:
-        m.reset()
-
     print(
         "Number of steps to reach the initial state => "
         + f"{steps_to_reach_initial_state()}"
@@ -46,23 +46,21 @@ def count_block_tiles(program):
 #          print("\n")
 
 
-def ball_and_paddle_x(game_tiles):
-    values = list(game_tiles.values())
-    keys = list(game_tiles.keys())
-    return keys[values.index(4)][0], keys[values.index(3)][0]
-
-
 def play(screen, program):
     if RENDER_GAME:
         curses.curs_set(0)
     computer = IntcodeComputer(program, return_output=True, return_before_input=True)
     current_score = 0
     game_tiles = {}
+    # The x position of the ball and the paddle is tracked as their tiles are drawn
+    # to avoid searching for them in the game tiles before every input.
+    ball_x = paddle_x = 0
     while True:
         output = computer.run()
         if output is computer.sentinel_return:
-            bx, px = ball_and_paddle_x(game_tiles)
-            computer.append_inputs(-1 if bx < px else 1 if bx > px else 0)
+            computer.append_inputs(
+                -1 if ball_x < paddle_x else 1 if ball_x > paddle_x else 0
+            )
             x = computer.run()
         else:
             x = output
@@ -74,6 +72,10 @@ def play(screen, program):
             current_score = tile_id
         else:
             game_tiles[(x, y)] = tile_id
+            if tile_id == 4:
+                ball_x = x
+            elif tile_id == 3:
+                paddle_x = x
         if RENDER_GAME:
             for (x1, y1), tile in game_tiles.items():
                 screen.addstr(y1, x1, COMPONENTS[tile])